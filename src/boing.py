@@ -15,10 +15,16 @@ Orientation:
 
 Backface culling:
 - Keep triangles with dot(normal, view_dir) < 0, view_dir = (0, −1, 0).
+- For triangle (a, b, c) with u = b − a, v = c − a, the normal n = u × v has
+  n.y = u.z·v.x − u.x·v.z, and dot(n, view_dir) = −n.y, so the test is n.y > 0.
+  Only that component is ever computed. Facets seen edge-on (n.y within
+  CULL_EPS·RADIUS² of zero) are dropped rather than left to rounding noise.
 """
 
+import functools
+import io
 import math
-from typing import List, Tuple
+from typing import Optional
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Configuration (edit here)
@@ -54,6 +60,9 @@ SPIN_DEG = 0.0     # rotate about +Z (polar axis)
 STROKE_WIDTH = 0.0
 STROKE_OVERRIDE = None  # None → stroke matches fill; or set to a hex color
 
+# Backface culling tolerance, relative to RADIUS²: facets seen edge-on are dropped
+CULL_EPS = 1e-9
+
 # ── GRID CONFIG ───────────────────────────────────────────────────────────────
 DRAW_GRID = True
 GRID_COLOR = "#660066"
@@ -67,128 +76,187 @@ GRID_ORIGIN_X = CX - (GRID_CELLS_W * GRID_CELL_W) / 2.0
 GRID_ORIGIN_Y = CY - (GRID_CELLS_H * GRID_CELL_H) / 2.0
 # ──────────────────────────────────────────────────────────────────────────────
 
-Vec3 = Tuple[float, float, float]
-Vec2 = Tuple[float, float]
-
 def deg2rad(a: float) -> float:
     return a * math.pi / 180.0
 
-def rot_z(p: Vec3, a_deg: float) -> Vec3:
-    a = deg2rad(a_deg)
-    c, s = math.cos(a), math.sin(a)
-    x, y, z = p
-    return (c*x - s*y, s*x + c*y, z)
-
-def rot_y(p: Vec3, a_deg: float) -> Vec3:
-    a = deg2rad(a_deg)
-    c, s = math.cos(a), math.sin(a)
-    x, y, z = p
-    # +Y rotation (right-handed)
-    return (c*x + s*z, y, -s*x + c*z)
-
-def cross(a: Vec3, b: Vec3) -> Vec3:
-    ax, ay, az = a
-    bx, by, bz = b
-    return (ay*bz - az*by, az*bx - ax*bz, ax*by - ay*bz)
-
-def sub(a: Vec3, b: Vec3) -> Vec3:
-    return (a[0]-b[0], a[1]-b[1], a[2]-b[2])
-
-def dot(a: Vec3, b: Vec3) -> float:
-    return a[0]*b[0] + a[1]*b[1] + a[2]*b[2]
-
-def sph_to_cart(lat: float, lon: float, r: float) -> Vec3:
-    # lat: −π/2..+π/2, lon: 0..2π
-    cl = math.cos(lat)
-    x = r * cl * math.cos(lon)
-    y = r * cl * math.sin(lon)
-    z = r * math.sin(lat)
-    return (x, y, z)
-
-def project_to_svg(p: Vec3) -> Vec2:
-    x, _, z = p
-    return (CX + x, CY - z)
-
-def polygon_svg(points2d: List[Vec2], fill: str, stroke_width: float, stroke_color: str) -> str:
-    pts = " ".join(f"{x:.3f},{y:.3f}" for x, y in points2d)
-    return f'<polygon points="{pts}" fill="{fill}" stroke="{stroke_color}" stroke-width="{stroke_width:.3f}" />\n'
+def spin_tilt_matrix(spin_deg: float, tilt_deg: float) -> tuple[tuple[float, float, float], ...]:
+    """Combined rotation Ry(tilt) · Rz(spin): spin about +Z first, then tilt about +Y."""
+    a, b = deg2rad(spin_deg), deg2rad(tilt_deg)
+    ca, sa = math.cos(a), math.sin(a)
+    cb, sb = math.cos(b), math.sin(b)
+    return (
+        ( cb*ca, -cb*sa, sb),
+        (    sa,     ca, 0.0),
+        (-sb*ca,  sb*sa, cb),
+    )
+
+# Each facet is a closed subpath of its color's <path>. Vertices are formatted
+# once as VERTEX_FMT and shared by every facet that touches them.
+VERTEX_FMT = '%d,%d'
+TRIANGLE_PATH_FMT = 'M%sL%sL%sZ'
 
 def grid_svg() -> str:
-    """Generate an orthographic X/Z grid with optional overflow beyond canvas."""
+    """Generate an orthographic X/Z grid with optional overflow beyond canvas.
+
+    All strokes, border included, go into a single <path>: one "M x y V y1"
+    subpath per vertical line and one "M x y H x1" per horizontal line. Square
+    caps close the border corners the way the old <rect> outline did.
+    Coordinates are written as integers whenever the grid origin and cell size
+    are whole numbers, falling back to "%.3f" otherwise.
+    """
     x0 = GRID_ORIGIN_X
     y0 = GRID_ORIGIN_Y
-    w = GRID_CELLS_W * GRID_CELL_W
-    h = GRID_CELLS_H * GRID_CELL_H
-    parts = []
-    parts.append(
-        f'<g stroke="{GRID_COLOR}" stroke-width="{GRID_STROKE_WIDTH}" '
-        f'shape-rendering="crispEdges" stroke-linecap="butt" fill="none">\n'
+    x1 = x0 + GRID_CELLS_W * GRID_CELL_W
+    y1 = y0 + GRID_CELLS_H * GRID_CELL_H
+    n = "%d" if all(float(v).is_integer() for v in (x0, y0, GRID_CELL_W, GRID_CELL_H)) else "%.3f"
+    v_fmt = f"M{n} {n}V{n}"
+    h_fmt = f"M{n} {n}H{n}"
+    d = "".join(
+        [v_fmt % (x0 + c * GRID_CELL_W, y0, y1) for c in range(GRID_CELLS_W + 1)]
+        + [h_fmt % (x0, y0 + r * GRID_CELL_H, x1) for r in range(GRID_CELLS_H + 1)]
+    )
+    return (
+        f'<path fill="none" stroke="{GRID_COLOR}" stroke-width="{GRID_STROKE_WIDTH}" '
+        f'shape-rendering="crispEdges" stroke-linecap="square" d="{d}"/>\n'
     )
-    # Outer border
-    parts.append(f'  <rect x="{x0:.3f}" y="{y0:.3f}" width="{w:.3f}" height="{h:.3f}" />\n')
-    # Vertical lines
-    for c in range(1, GRID_CELLS_W):
-        x = x0 + c * GRID_CELL_W
-        parts.append(f'  <line x1="{x:.3f}" y1="{y0:.3f}" x2="{x:.3f}" y2="{(y0+h):.3f}" />\n')
-    # Horizontal lines
-    for r in range(1, GRID_CELLS_H):
-        y = y0 + r * GRID_CELL_H
-        parts.append(f'  <line x1="{x0:.3f}" y1="{y:.3f}" x2="{(x0+w):.3f}" y2="{y:.3f}" />\n')
-    parts.append('</g>\n')
-    return "".join(parts)
-
-def build_boing_svg() -> str:
+
+@functools.lru_cache(maxsize=1)
+def sphere_grid(lat_bands: int, long_gores: int, radius: float
+                ) -> tuple[tuple[tuple[float, ...], ...], tuple[tuple[float, ...], ...], tuple[float, ...]]:
+    """Object-space (unrotated) sphere vertices as gore-major tables (OX, OY, OZ).
+
+    OX[j][i] and OY[j][i] are the vertex at longitude j, latitude i; z depends on
+    latitude only, so OZ is a single row. Only the tessellation and radius feed
+    into this, so it is computed once and reused when just the orientation
+    changes (e.g. spinning animation frames).
+    """
+    lats = [(-math.pi/2) + (i * math.pi / lat_bands) for i in range(lat_bands + 1)]
+    lons = [(j * 2*math.pi / long_gores) for j in range(long_gores + 1)]  # wrap last==2π
+
+    # Trig tables: lat −π/2..+π/2, lon 0..2π; each sin/cos is evaluated once.
+    rcl = [radius*math.cos(lat) for lat in lats]
+    rsl = [radius*math.sin(lat) for lat in lats]
+    cos_lon = [math.cos(lon) for lon in lons]
+    sin_lon = [math.sin(lon) for lon in lons]
+
+    OX = tuple(tuple(rc*co for rc in rcl) for co in cos_lon)
+    OY = tuple(tuple(rc*so for rc in rcl) for so in sin_lon)
+    return OX, OY, tuple(rsl)
+
+def compute_facets(spin_deg: Optional[float] = None,
+                   tilt_deg: Optional[float] = None
+                   ) -> tuple[list[tuple[int, int]], list[tuple[int, int, int]], list[tuple[int, int, int]]]:
+    """Purely numeric sphere pass: no SVG strings are built here.
+
+    spin_deg/tilt_deg default to SPIN_DEG/TILT_DEG.
+
+    Every quad contributes two triangles, (w00, w10, w11) then (w00, w11, w01),
+    except at the poles: in the first band w01 == w00 and in the last band
+    w10 == w11, so the zero-area triangle is skipped. The grid is walked once per
+    checker color, gore-major (j outer, i inner), visiting only that color's quads.
+
+    Returns (points, red, white):
+    - points: projected (sx, sy) of every grid vertex in whole pixels, gore-major;
+              vertex (i, j) is points[j*(LAT_BANDS+1) + i] for j < LONG_GORES
+              (the seam column j == LONG_GORES is the same as j == 0 and is
+              referenced as such)
+    - red, white: the front-facing triangles of each color as index triples into
+              points, so a vertex shared by several facets is projected once
+    """
     assert LAT_BANDS % 2 == 0 and LONG_GORES % 2 == 0, "Even counts required for checkerboard."
 
-    lats = [(-math.pi/2) + (i * math.pi / LAT_BANDS) for i in range(LAT_BANDS + 1)]
-    lons = [(j * 2*math.pi / LONG_GORES) for j in range(LONG_GORES + 1)]  # wrap last==2π
+    if spin_deg is None:
+        spin_deg = SPIN_DEG
+    if tilt_deg is None:
+        tilt_deg = TILT_DEG
+    (r00, r01, r02), _, (r20, r21, r22) = spin_tilt_matrix(spin_deg, tilt_deg)
+
+    OX, OY, OZ = sphere_grid(LAT_BANDS, LONG_GORES, RADIUS)
+
+    # Transformed vertex grid, stored gore-major as separate X and Z tables:
+    # X[j][i] is the vertex at longitude j, latitude i, so the inner loop over
+    # bands walks one contiguous row. Y is dropped by the orthographic projection
+    # and never needed for culling, so it is not computed at all.
+    X: list[list[float]] = []
+    Z: list[list[float]] = []
+    for ox, oy in zip(OX, OY):
+        X.append([r00*a + r01*b + r02*c for a, b, c in zip(ox, oy, OZ)])
+        Z.append([r20*a + r21*b + r22*c for a, b, c in zip(ox, oy, OZ)])
+
+    # Orthographic projection of the whole grid: sx = cx + x, sy = cy − z,
+    # quantized once per vertex to whole pixels (sub-pixel precision is invisible
+    # at canvas scale, and integers format far faster than "%.3f").
+    points = [(round(CX + x), round(CY - z))
+              for xs, zs in zip(X[:LONG_GORES], Z[:LONG_GORES]) for x, z in zip(xs, zs)]
+
+    # Per band: (i, emit (w00, w10, w11), emit (w00, w11, w01)), split by the
+    # parity of i. Quad (i, j) is red when i and j have the same parity.
+    bands = [
+        [(i,
+          i != LAT_BANDS - 1,  # north pole band: w10 == w11
+          i != 0)              # south pole band: w01 == w00
+         for i in range(parity, LAT_BANDS, 2)]
+        for parity in (0, 1)
+    ]
+
+    red: list[tuple[int, int, int]] = []
+    white: list[tuple[int, int, int]] = []
+    n = LAT_BANDS + 1
+
+    # With view_dir = (0, −1, 0), dot(n, view_dir) < 0 reduces to n.y > 0,
+    # and n.y only needs X and Z:
+    #   n.y = (b.z − a.z)(c.x − a.x) − (b.x − a.x)(c.z − a.z)
+    # Both triangles of a quad share the diagonal w00→w11, so its deltas are
+    # computed once and reused. Edge-on facets have n.y ≈ 0 up to rounding noise,
+    # so they are dropped deterministically by a tolerance relative to RADIUS².
+    eps = CULL_EPS * RADIUS * RADIUS
+    for c, out in enumerate((red, white)):
+        append = out.append
+        for j in range(LONG_GORES):
+            X0, X1, Z0, Z1 = X[j], X[j+1], Z[j], Z[j+1]
+            k0, k1 = j*n, (j + 1) % LONG_GORES * n
+            for i, emit1, emit2 in bands[(j + c) % 2]:
+                x00, x10, x11, x01 = X0[i], X0[i+1], X1[i+1], X1[i]
+                z00, z10, z11, z01 = Z0[i], Z0[i+1], Z1[i+1], Z1[i]
+                dx, dz = x11 - x00, z11 - z00
+
+                if emit1 and (z10 - z00)*dx - (x10 - x00)*dz > eps:
+                    append((k0 + i, k0 + i + 1, k1 + i + 1))
+
+                if emit2 and dz*(x01 - x00) - dx*(z01 - z00) > eps:
+                    append((k0 + i, k1 + i + 1, k1 + i))
 
-    def xform(v: Vec3) -> Vec3:
-        return rot_y(rot_z(v, SPIN_DEG), TILT_DEG)
+    return points, red, white
 
-    view_dir = (0.0, -1.0, 0.0)  # camera looks along −Y
+def build_boing_svg(spin_deg: Optional[float] = None, tilt_deg: Optional[float] = None) -> str:
+    """Render the full SVG document (background, grid, sphere facets) as text.
 
-    svg = []
-    svg.append(f'<svg xmlns="http://www.w3.org/2000/svg" width="{CANVAS_W}" height="{CANVAS_H}" viewBox="0 0 {CANVAS_W} {CANVAS_H}">\n')
+    spin_deg/tilt_deg default to SPIN_DEG/TILT_DEG; override them to render
+    animation frames without rebuilding the object-space sphere.
+    """
+    points, red, white = compute_facets(spin_deg, tilt_deg)
+
+    svg = io.StringIO()
+    svg.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{CANVAS_W}" height="{CANVAS_H}" viewBox="0 0 {CANVAS_W} {CANVAS_H}">\n')
 
     if DRAW_BACKGROUND:
-        svg.append(f'  <rect x="0" y="0" width="{CANVAS_W}" height="{CANVAS_H}" fill="{BACKGROUND_COLOR}"/>\n')
+        svg.write(f'  <rect x="0" y="0" width="{CANVAS_W}" height="{CANVAS_H}" fill="{BACKGROUND_COLOR}"/>\n')
 
     if DRAW_GRID:
-        svg.append(grid_svg())
-
-    # Sphere facets
-    for i in range(LAT_BANDS):
-        lat0, lat1 = lats[i], lats[i+1]
-        for j in range(LONG_GORES):
-            lon0, lon1 = lons[j], lons[j+1]
-
-            v00 = sph_to_cart(lat0, lon0, RADIUS)
-            v10 = sph_to_cart(lat1, lon0, RADIUS)
-            v11 = sph_to_cart(lat1, lon1, RADIUS)
-            v01 = sph_to_cart(lat0, lon1, RADIUS)
-
-            w00 = xform(v00)
-            w10 = xform(v10)
-            w11 = xform(v11)
-            w01 = xform(v01)
-
-            tris = [
-                (w00, w10, w11),
-                (w00, w11, w01),
-            ]
-
-            fill = COLOR_RED if ((i + j) % 2 == 0) else COLOR_WHITE
-            stroke_color = STROKE_OVERRIDE if STROKE_OVERRIDE is not None else fill
-
-            for (a, b, c_) in tris:
-                n = cross(sub(b, a), sub(c_, a))
-                if dot(n, view_dir) < 0.0:
-                    pts2d = [project_to_svg(a), project_to_svg(b), project_to_svg(c_)]
-                    svg.append("  " + polygon_svg(pts2d, fill, STROKE_WIDTH, stroke_color))
-
-    svg.append("</svg>\n")
-    return "".join(svg)
+        svg.write(grid_svg())
+
+    # Sphere facets, batched into a single <path> per checker color
+    # Every grid vertex is formatted, back-facing ones included: collecting just
+    # the indices the facets reference costs more than the formats it saves.
+    labels = [VERTEX_FMT % p for p in points]
+    for fill, tris in ((COLOR_RED, red), (COLOR_WHITE, white)):
+        stroke_color = STROKE_OVERRIDE if STROKE_OVERRIDE is not None else fill
+        svg.write(f'  <g fill="{fill}" stroke="{stroke_color}" stroke-width="{STROKE_WIDTH:.3f}"><path d="')
+        svg.write("".join([TRIANGLE_PATH_FMT % (labels[a], labels[b], labels[c]) for a, b, c in tris]))
+        svg.write('"/></g>\n')
+
+    svg.write("</svg>\n")
+    return svg.getvalue()
 
 def main() -> None:
     content = build_boing_svg()
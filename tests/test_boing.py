@@ -0,0 +1,114 @@
+"""Regression tests for the sphere facet pipeline in src/boing.py."""
+
+import math
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+import boing  # noqa: E402
+
+# (spin_deg, tilt_deg)
+# (11.25, 16) puts whole gores edge-on at the silhouette.
+ORIENTATIONS = [(0.0, 16.0), (11.25, 16.0), (33.0, 45.0), (90.0, -30.0)]
+
+
+def rot_z(p, a_deg):
+    a = math.radians(a_deg)
+    c, s = math.cos(a), math.sin(a)
+    x, y, z = p
+    return (c*x - s*y, s*x + c*y, z)
+
+
+def rot_y(p, a_deg):
+    a = math.radians(a_deg)
+    c, s = math.cos(a), math.sin(a)
+    x, y, z = p
+    return (c*x + s*z, y, -s*x + c*z)
+
+
+def cross(a, b):
+    ax, ay, az = a
+    bx, by, bz = b
+    return (ay*bz - az*by, az*bx - ax*bz, ax*by - ay*bx)
+
+
+def sub(a, b):
+    return (a[0]-b[0], a[1]-b[1], a[2]-b[2])
+
+
+def dot(a, b):
+    return a[0]*b[0] + a[1]*b[1] + a[2]*b[2]
+
+
+def reference_facets(spin_deg, tilt_deg):
+    """Straightforward per-quad pipeline: full cross product, dot with view_dir.
+
+    Returns ({vertex index: (sx, sy)}, red, white) using compute_facets' vertex
+    indexing, so the two can be compared directly.
+    """
+    lat_bands, long_gores, radius = boing.LAT_BANDS, boing.LONG_GORES, boing.RADIUS
+    n = lat_bands + 1
+    view_dir = (0.0, -1.0, 0.0)
+    eps = boing.CULL_EPS * radius * radius
+
+    def vertex(i, j):
+        lat = -math.pi/2 + i * math.pi / lat_bands
+        lon = j * 2*math.pi / long_gores
+        v = (radius*math.cos(lat)*math.cos(lon),
+             radius*math.cos(lat)*math.sin(lon),
+             radius*math.sin(lat))
+        return rot_y(rot_z(v, spin_deg), tilt_deg)
+
+    def index(i, j):
+        return (j % long_gores)*n + i
+
+    points = {}
+    red, white = set(), set()
+    for i in range(lat_bands):
+        for j in range(long_gores):
+            corners = {(i, j), (i+1, j), (i+1, j+1), (i, j+1)}
+            w = {c: vertex(*c) for c in corners}
+            for tri in (((i, j), (i+1, j), (i+1, j+1)),
+                        ((i, j), (i+1, j+1), (i, j+1))):
+                a, b, c = (w[v] for v in tri)
+                if dot(cross(sub(b, a), sub(c, a)), view_dir) < -eps:
+                    (red if (i + j) % 2 == 0 else white).add(tuple(index(*v) for v in tri))
+                    for v in tri:
+                        x, _, z = w[v]
+                        points[index(*v)] = (boing.CX + x, boing.CY - z)
+    return points, red, white
+
+
+class ComputeFacetsTest(unittest.TestCase):
+
+    def test_culled_set_matches_reference(self):
+        for spin, tilt in ORIENTATIONS:
+            with self.subTest(spin=spin, tilt=tilt):
+                points, red, white = boing.compute_facets(spin, tilt)
+                ref_points, ref_red, ref_white = reference_facets(spin, tilt)
+                self.assertEqual(set(red), ref_red)
+                self.assertEqual(set(white), ref_white)
+                self.assertEqual(len(red), len(ref_red))
+                self.assertEqual(len(white), len(ref_white))
+                for k, (sx, sy) in ref_points.items():
+                    self.assertLessEqual(abs(points[k][0] - sx), 0.5 + 1e-9)
+                    self.assertLessEqual(abs(points[k][1] - sy), 0.5 + 1e-9)
+
+    def test_no_triangle_repeats_a_polar_vertex(self):
+        n = boing.LAT_BANDS + 1
+        for spin, tilt in ORIENTATIONS:
+            with self.subTest(spin=spin, tilt=tilt):
+                _, red, white = boing.compute_facets(spin, tilt)
+                for tri in red + white:
+                    bands = [k % n for k in tri]
+                    self.assertLessEqual(bands.count(0), 1, tri)
+                    self.assertLessEqual(bands.count(boing.LAT_BANDS), 1, tri)
+
+    def test_default_orientation(self):
+        self.assertEqual(boing.compute_facets(), boing.compute_facets(boing.SPIN_DEG, boing.TILT_DEG))
+
+
+if __name__ == "__main__":
+    unittest.main()